@@ -74,19 +74,31 @@ def extract_timeslice(segy_filename, out_filename, slice_index, dtype=None, null
 
         timeslice = np.full((i_size, x_size), null, dtype)
 
-        for inline_num, xline_num in segy_reader.inline_xline_numbers():
-            trace_index = segy_reader.trace_index((inline_num, xline_num))
-            trace = segy_reader.trace_samples(trace_index)
-
-            try:
-                sample = trace[slice_index]
-            except IndexError:
-                sample = null
-
-            i_index = segy_reader.inline_numbers().index(inline_num)
-            x_index = segy_reader.xline_numbers().index(xline_num)
-
-            timeslice[i_index, x_index] = sample
+        inline_indexes = {inline_num: i for i, inline_num in enumerate(segy_reader.inline_numbers())}
+        xline_indexes = {xline_num: x for x, xline_num in enumerate(segy_reader.xline_numbers())}
+
+        trace_index_of = segy_reader.trace_index
+        num_trace_samples = segy_reader.num_trace_samples
+        trace_samples = segy_reader.trace_samples
+        slice_stop = slice_index + 1
+
+        def slice_sample(inline_xline):
+            trace_index = trace_index_of(inline_xline)
+            if slice_index >= num_trace_samples(trace_index):
+                return null
+            return trace_samples(trace_index, slice_index, slice_stop)[0]
+
+        inline_xline_numbers = list(segy_reader.inline_xline_numbers())
+        num_traces = len(inline_xline_numbers)
+
+        i_indexes = np.fromiter((inline_indexes[inline_num] for inline_num, _ in inline_xline_numbers),
+                                dtype=np.intp, count=num_traces)
+        x_indexes = np.fromiter((xline_indexes[xline_num] for _, xline_num in inline_xline_numbers),
+                                dtype=np.intp, count=num_traces)
+        samples = np.fromiter(map(slice_sample, inline_xline_numbers),
+                              dtype=dtype, count=num_traces)
+
+        timeslice[i_indexes, x_indexes] = samples
 
         np.save(out_filename, timeslice)
 
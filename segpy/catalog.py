@@ -9,12 +9,13 @@ the CatalogBuilder class which will analyse the contents of the
 mapping to find a space and time efficient representation.
 """
 
-from collections import Mapping, Sequence, OrderedDict
-from fractions import Fraction
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence, Sized
 import reprlib
 from segpy.sorted_set import SortedFrozenSet
 
-from segpy.util import contains_duplicates, measure_stride, make_sorted_distinct_sequence
+from segpy.util import (contains_duplicates, measure_stride, measure_stride_and_duplicates,
+                        make_sorted_distinct_sequence)
 
 
 class CatalogBuilder(object):
@@ -34,10 +35,10 @@ class CatalogBuilder(object):
         Args:
             mapping: An optional mapping (such as a dictionary) of items.
         """
-        self._catalog = []
+        self._keys = []
+        self._values = []
         if mapping is not None:
-            for key, value in mapping.items():
-                self.add(key, value)
+            self.extend(mapping.keys(), mapping.values())
 
     def add(self, index, value):
         """Add an item.
@@ -47,7 +48,33 @@ class CatalogBuilder(object):
         accepted by this call without complaint.
 
         """
-        self._catalog.append((index, value))
+        self._keys.append(index)
+        self._values.append(value)
+
+    def extend(self, indexes, values):
+        """Add many items at once.
+
+        This is equivalent to calling add() for each corresponding index
+        and value, but is more efficient.
+
+        Args:
+            indexes: An iterable series of indexes.
+
+            values: An iterable series of values, of the same length as indexes.
+
+        Raises:
+            ValueError: If indexes and values are of different lengths.
+        """
+        # Only materialise plain iterables, to avoid copying large sequences
+        if not isinstance(indexes, Sized):
+            indexes = list(indexes)
+        if not isinstance(values, Sized):
+            values = list(values)
+        if len(indexes) != len(values):
+            raise ValueError("CatalogBuilder.extend() given {} indexes but {} values"
+                             .format(len(indexes), len(values)))
+        self._keys.extend(indexes)
+        self._values.extend(values)
 
     def create(self):
         """Create a possibly more optimized representation of the mapping.
@@ -65,36 +92,48 @@ class CatalogBuilder(object):
         # This method examines the contents of the mapping using
         # various heuristics to come up with a better representation.
 
-        if len(self._catalog) < 2:
-            return DictionaryCatalog(self._catalog)
-
-        # In-place sort by index
-        self._catalog.sort(key=lambda index_value: index_value[0])
+        if len(self._keys) < 2:
+            return DictionaryCatalog(zip(self._keys, self._values))
 
-        if contains_duplicates(index for index, value in self._catalog):
-            return None
+        self._sort_by_index()
 
-        if all(isinstance(index, Sequence) and (len(index) == 2)
-               for index, value in self._catalog):
+        if all(map(_is_pair, self._keys)):
+            if contains_duplicates(self._keys):
+                return None
             return self._create_catalog_2()
 
         return self._create_catalog_1()
 
+    def _sort_by_index(self):
+        """Sort the parallel index and value lists by index.
+        """
+        keys = self._keys
+        values = self._values
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[k] for k in order]
+        self._values = [values[k] for k in order]
+
     def _create_catalog_1(self):
         """Create a catalog for one-dimensional integer keys (i.e. scalars)
+
+        Returns:
+            A mapping, or None if the keys contain duplicates.
         """
-        index_min = self._catalog[0][0]
-        index_max = self._catalog[-1][0]
-        index_stride = measure_stride(index for index, value in self._catalog)
+        index_stride, has_duplicates = measure_stride_and_duplicates(self._keys)
+        if has_duplicates:
+            return None
         assert index_stride != 0
 
-        value_start = self._catalog[0][1]
-        value_stop = self._catalog[-1][1]
-        value_stride = measure_stride(value for index, value in self._catalog)
+        index_min = self._keys[0]
+        index_max = self._keys[-1]
+
+        value_start = self._values[0]
+        value_stop = self._values[-1]
+        value_stride = measure_stride(self._values)
 
         if index_stride is None and value_stride is None:
             # Dictionary strategy - arbitrary keys and values
-            return DictionaryCatalog(self._catalog)
+            return DictionaryCatalog(zip(self._keys, self._values))
 
         if index_stride is not None and value_stride == 0:
             assert value_start == value_stop
@@ -105,16 +144,14 @@ class CatalogBuilder(object):
 
         if index_stride is None and value_stride == 0:
             assert value_start == value_stop
-            return ConstantCatalog(
-                    (index for index, value in self._catalog),
-                    value_start)
+            return ConstantCatalog(self._keys, value_start)
 
         if index_stride is not None and value_stride is None:
             # Regular index - regular keys and arbitrary values
             return RegularCatalog(index_min,
                                   index_max,
                                   index_stride,
-                                  (value for index, value in self._catalog))
+                                  self._values)
 
         if (index_stride is not None) and (value_stride is not None):
             assert value_stride != 0
@@ -125,41 +162,54 @@ class CatalogBuilder(object):
                                         value_stop,
                                         value_stride)
 
-        return DictionaryCatalog(self._catalog)
+        return DictionaryCatalog(zip(self._keys, self._values))
 
     def _create_catalog_2(self):
         """Create a catalog for two-dimensional integer keys.
 
         Each key must be a two-element sequence.
         """
-        i_sorted = make_sorted_distinct_sequence(i for (i, j), value in self._catalog)
-        j_sorted = make_sorted_distinct_sequence(j for (i, j), value in self._catalog)
+        i_keys = [i for i, j in self._keys]
+        j_keys = [j for i, j in self._keys]
+
+        i_sorted = make_sorted_distinct_sequence(i_keys)
+        j_sorted = make_sorted_distinct_sequence(j_keys)
 
         i_is_regular = isinstance(i_sorted, range)
         j_is_regular = isinstance(j_sorted, range)
 
         if i_is_regular and j_is_regular:
-            is_rm, diff = self._is_row_major(i_sorted, j_sorted)
+            is_rm, diff = self._is_row_major(i_sorted, j_sorted, i_keys, j_keys)
             if is_rm:
                 return RowMajorCatalog2D(i_sorted, j_sorted, diff)
 
-        return DictionaryCatalog2D(i_sorted, j_sorted, self._catalog)
+        return DictionaryCatalog2D(i_sorted, j_sorted, zip(self._keys, self._values))
 
-    def _is_row_major(self, i_sorted, j_sorted):
+    def _is_row_major(self, i_sorted, j_sorted, i_keys, j_keys):
         i_min = i_sorted[0]
         j_min = j_sorted[0]
-        j_max = j_sorted[-1]
-        diff = None
-        for (i, j), actual_value in self._catalog:
-            proposed_value = (i - i_min) * (j_max + 1 - j_min) + (j - j_min)
-            current_diff = actual_value - proposed_value
-            if diff is None:
-                diff = current_diff
-            if current_diff != diff:
+        j_span = j_sorted[-1] + 1 - j_min
+        diff = self._values[0] - ((i_keys[0] - i_min) * j_span + (j_keys[0] - j_min))
+        # Fold the constant terms of the row-major prediction into a single
+        # offset so the loop below does the minimum of arithmetic per item.
+        offset = diff - i_min * j_span - j_min
+        for i, j, actual_value in zip(i_keys, j_keys, self._values):
+            if actual_value - i * j_span - j != offset:
                 return False, None
         return True, diff
 
 
+def _is_pair(index):
+    """Determine whether an index is a two-element sequence.
+
+    Tuples, by far the most common case, are recognised by an exact type
+    check before falling back to the comparatively slow Sequence ABC check.
+    """
+    if type(index) is tuple:
+        return len(index) == 2
+    return isinstance(index, Sequence) and (len(index) == 2)
+
+
 class Catalog2D(Mapping):
     """An abstract base class for 2D catalogs.
     """
@@ -248,17 +298,20 @@ class RowMajorCatalog2D(Catalog2D):
         """
         super().__init__(i_range, j_range)
         self._c = constant
+        # Partially evaluate the row-major formula so that lookups need only
+        # compute v = i * j_span + j + offset
+        self._j_span = self.j_max + 1 - self.j_min
+        self._offset = constant - self.i_min * self._j_span - self.j_min
 
     @property
     def constant(self):
         return self._c
 
     def __getitem__(self, key):
-        if key not in self:
-            raise KeyError("{!r} key {!r} out of range".format(self, key))
         i, j = key
-        value = (i - self.i_min) * (self.j_max + 1 - self.j_min) + (j - self.j_min) + self._c
-        return value
+        if (i not in self._i_range) or (j not in self._j_range):
+            raise KeyError("{!r} key {!r} out of range".format(self, key))
+        return i * self._j_span + j + self._offset
 
     def __contains__(self, key):
         return (key[0] in self._i_range) and \
@@ -551,19 +604,13 @@ class LinearRegularCatalog(Mapping):
                                  num_keys,
                                  num_values))
 
-        self._m = Fraction(self._value_stop - self._value_start,
-                           self._key_max - self._key_min)
-
     def __getitem__(self, key):
         if not (self._key_min <= key <= self._key_max):
             raise KeyError("{!r} key {!r} out of range".format(self, key))
-        offset = key - self._key_min
-        if offset % self._key_stride != 0:
+        index, remainder = divmod(key - self._key_min, self._key_stride)
+        if remainder != 0:
             raise KeyError("{!r} does not contain key {!r}".format(self, key))
-
-        v = self._m * (key - self._key_min) + self._value_start
-        assert v.denominator == 1
-        return v.numerator
+        return index * self._value_stride + self._value_start
 
     def __len__(self):
         return 1 + (self._key_max - self._key_min) // self._key_stride
@@ -51,7 +51,14 @@ class Header:
 
         if cls is Header:
             return cls._ordered_field_names
-        return super_class(cls).ordered_field_names() + cls._ordered_field_names
+        # The names are combined from the whole class hierarchy once, and then
+        # cached on the class, since this is called for every header constructed.
+        try:
+            return cls.__dict__['_all_ordered_field_names']
+        except KeyError:
+            names = super_class(cls).ordered_field_names() + cls._ordered_field_names
+            cls._all_ordered_field_names = names
+            return names
 
     def copy(self, **updates):
         fields = {name: getattr(self, name) for name in self.ordered_field_names()}
@@ -1,9 +1,6 @@
 from math import frexp, isnan, isinf, ceil, floor, trunc
 from numbers import Real
 
-from segpy.util import four_bytes
-
-
 
 IBM_ZERO_BYTES = b'\x00\x00\x00\x00'
 IBM_NEGATIVE_ONE_BYTES = b'\xc1\x10\x00\x00'
@@ -28,16 +25,23 @@ MIN_EXACT_INTEGER_IBM_FLOAT = -2**MAX_BITS_PRECISION_IBM_FLOAT
 MAX_EXACT_INTEGER_IBM_FLOAT = 2**MIN_BITS_PRECISION_IBM_FLOAT
 
 
-def ibm2ieee(big_endian_bytes):
+def ibm2ieee(big_endian_bytes, offset=0):
     """Interpret a byte string as a big-endian IBM float.
 
     Args:
         big_endian_bytes (str): A string containing at least four bytes.
 
+        offset (int): The index of the first of the four bytes to be
+            interpreted, allowing floats to be read from within a larger
+            buffer without slicing it. Defaults to zero.
+
     Returns:
         The floating point value.
     """
-    a, b, c, d = four_bytes(big_endian_bytes)
+    a = big_endian_bytes[offset]
+    b = big_endian_bytes[offset + 1]
+    c = big_endian_bytes[offset + 2]
+    d = big_endian_bytes[offset + 3]
 
     if b == c == d == 0:
         return 0.0
@@ -174,6 +178,40 @@ class IBMFloat(Real):
     def from_bytes(cls, b):
         return cls(b)
 
+    @classmethod
+    def series_from_bytes(cls, big_endian_bytes, num_items):
+        """Interpret a byte string as a series of big-endian IBM floats.
+
+        This is equivalent to calling from_bytes() on each successive four
+        byte slice, but validates the length of the data once rather than
+        for each item.
+
+        Args:
+            big_endian_bytes: A bytes-like object containing at least
+                4 * num_items bytes.
+
+            num_items: The number of floats to be read.
+
+        Returns:
+            A list of instances of cls.
+
+        Raises:
+            ValueError: If big_endian_bytes contains too few bytes.
+        """
+        data = bytes(big_endian_bytes)
+        num_bytes = num_items * 4
+        if len(data) < num_bytes:
+            raise ValueError("{} {}s cannot be read from {} bytes".format(num_items, cls.__name__, len(data)))
+
+        new = object.__new__
+        ibm_floats = []
+        append = ibm_floats.append
+        for i in range(0, num_bytes, 4):
+            ibm = new(cls)
+            ibm._data = data[i:i + 4]
+            append(ibm)
+        return ibm_floats
+
     @classmethod
     def ldexp(cls, fraction, exponent):
         """Make an IBMFloat from fraction and exponent.
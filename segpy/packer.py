@@ -1,6 +1,8 @@
 from collections import OrderedDict
+from functools import lru_cache
 from struct import Struct
 from itertools import zip_longest
+from operator import attrgetter
 
 from segpy import __version__
 from segpy.datatypes import SEG_Y_TYPE_TO_CTYPE
@@ -115,7 +117,22 @@ def compile_struct(header_format_class, start_offset=0, length_in_bytes=None, en
     return cformat, field_name_allocations
 
 
+@lru_cache(maxsize=32)
 def make_header_packer(header_format_class, endian='>'):
+    """Obtain a packer for converting between headers and their binary representation.
+
+    Packers are immutable, so they are cached and shared between callers; each
+    header format is compiled at most once for each endianness.
+
+    Args:
+        header_format_class: A header_format class.
+
+        endian: '>' for big-endian data (the standard and default), '<'
+            for little-endian (non-standard).
+
+    Returns:
+        A HeaderPacker for header_format_class.
+    """
     cformat, field_name_allocations = compile_struct(
         header_format_class,
         header_format_class.START_OFFSET_IN_BYTES,
@@ -130,6 +147,23 @@ def make_header_packer(header_format_class, endian='>'):
     return SurjectiveHeaderPacker(header_format_class, structure, field_name_allocations)
 
 
+def _make_field_values_getter(field_name_allocations):
+    """Make a callable which retrieves the values to be packed from a header.
+
+    Args:
+        field_name_allocations: A list-of-lists of field names, as returned by compile_struct().
+
+    Returns:
+        A callable which when passed a header returns a tuple containing the value of
+        the first named field of each allocation, in order.
+    """
+    representative_names = [names[0] for names in field_name_allocations]
+    if len(representative_names) == 1:
+        name = representative_names[0]
+        return lambda header: (getattr(header, name),)
+    return attrgetter(*representative_names)
+
+
 class HeaderPacker:
     """Packing and unpacking header instances."""
 
@@ -137,12 +171,14 @@ class HeaderPacker:
         self._header_format_class = header_format_class
         self._structure = structure
         self._field_name_allocations = field_name_allocations
+        self._field_values = _make_field_values_getter(field_name_allocations)
 
     def __getstate__(self):
         state = self.__dict__.copy()
         state['__version__'] = __version__
         state['_structure_format'] = self._structure.format
         del state['_structure']
+        del state['_field_values']
         return state
 
     def __setstate__(self, state):
@@ -156,6 +192,7 @@ class HeaderPacker:
         structure = Struct(state['_structure_format'])
         state['_structure'] = structure
         del state['_structure_format']
+        state['_field_values'] = _make_field_values_getter(state['_field_name_allocations'])
         self.__dict__.update(state)
 
     @property
@@ -171,7 +208,7 @@ class HeaderPacker:
                 self._header_format_class.__name__,
                 header.__class__.__name__
             ))
-        values = [getattr(header, names[0]) for names in self._field_name_allocations]
+        values = self._field_values(header)
         return self._structure.pack(*values)
 
     def __repr__(self):
@@ -12,11 +12,11 @@ import logging
 
 from segpy import __version__
 from segpy.dataset import Dataset
-from segpy.encoding import ASCII
+from segpy.encoding import ASCII, guess_encoding
 from segpy.packer import make_header_packer
 from segpy.trace_header import TraceHeaderRev1
 from segpy.util import file_length, filename_from_handle, make_sorted_distinct_sequence, hash_for_file, UNKNOWN_FILENAME
-from segpy.datatypes import DATA_SAMPLE_FORMAT_TO_SEG_Y_TYPE, SEG_Y_TYPE_DESCRIPTION, SEG_Y_TYPE_TO_CTYPE, size_in_bytes
+from segpy.datatypes import DATA_SAMPLE_FORMAT_TO_SEG_Y_TYPE, SEG_Y_TYPE_DESCRIPTION
 from segpy.toolkit import (extract_revision,
                            bytes_per_sample,
                            read_binary_reel_header,
@@ -25,9 +25,10 @@ from segpy.toolkit import (extract_revision,
                            read_binary_values,
                            REEL_HEADER_NUM_BYTES,
                            TRACE_HEADER_NUM_BYTES,
-                           read_textual_reel_header,
+                           read_raw_textual_reel_header,
+                           decode_textual_reel_header,
                            read_extended_textual_headers,
-                           guess_textual_header_encoding, validate_binary_reel_header)
+                           validate_binary_reel_header)
 
 
 log = logging.getLogger(__name__)
@@ -236,11 +237,13 @@ def _load_reader_from_cache(cache_file_path, seg_y_path):
 
 
 def _make_reader(fh, encoding, trace_header_format, endian, progress, dimensionality):
+    # Read the textual header once, both to guess its encoding and to decode it.
+    raw_textual_reel_header = read_raw_textual_reel_header(fh)
     if encoding is None:
-        encoding = guess_textual_header_encoding(fh)
+        encoding = guess_encoding(raw_textual_reel_header)
     if encoding is None:
         encoding = ASCII
-    textual_reel_header = read_textual_reel_header(fh, encoding)
+    textual_reel_header = decode_textual_reel_header(raw_textual_reel_header, encoding)
     binary_reel_header = read_binary_reel_header(fh, endian)
     validate_binary_reel_header(binary_reel_header, endian)
     extended_textual_header = read_extended_textual_headers(fh, binary_reel_header, encoding)
@@ -463,7 +466,7 @@ class SegYReader(Dataset):
         seg_y_type = self.data_sample_format
         start_pos = (self._trace_offset_catalog[trace_index]
                      + TRACE_HEADER_NUM_BYTES
-                     + start_sample * size_in_bytes(SEG_Y_TYPE_TO_CTYPE[seg_y_type]))
+                     + start_sample * self._bytes_per_sample)
         num_samples_to_read = stop_sample - start_sample
 
         trace_values = read_binary_values(
@@ -2,8 +2,12 @@ from __future__ import print_function
 
 from array import array
 from collections import OrderedDict
-from itertools import zip_longest, count
+from functools import lru_cache
+from itertools import zip_longest
+from operator import itemgetter
 
+import io
+import mmap
 import os
 import struct
 import re
@@ -15,8 +19,8 @@ from segpy.catalog import CatalogBuilder
 from segpy.datatypes import SEG_Y_TYPE_TO_CTYPE, size_in_bytes, DATA_SAMPLE_FORMAT_TO_SEG_Y_TYPE, CTYPE_TO_SIZE, ENDIAN
 from segpy.encoding import guess_encoding, is_supported_encoding, UnsupportedEncodingError
 from segpy.header import SubFormatMeta
-from segpy.ibm_float import IBMFloat
-from segpy.packer import make_header_packer
+from segpy.ibm_float import IBMFloat, ieee2ibm
+from segpy.packer import make_header_packer, compile_struct
 from segpy.revisions import canonicalize_revision
 from segpy.trace_header import TraceHeaderRev1
 from segpy.util import file_length, batched, pad, complementary_intervals, NATIVE_ENDIANNESS, EMPTY_BYTE_STRING, \
@@ -176,15 +180,46 @@ def read_textual_reel_header(fh, encoding):
     Returns:
         A tuple of forty Unicode strings containing the transcoded header data.
     """
+    raw_header = read_raw_textual_reel_header(fh)
+    return decode_textual_reel_header(raw_header, encoding)
+
+
+def read_raw_textual_reel_header(fh):
+    """Read the undecoded bytes of the SEG Y card image header.
+
+    Args:
+        fh: A file-like object open in binary mode positioned such that the
+            beginning of the textual header will be the next byte to read.
+
+    Returns:
+        A bytes object containing the encoded textual header.
+
+    Raises:
+        EOFError: If the complete textual header could not be read.
+    """
     raw_header = fh.read(TEXTUAL_HEADER_NUM_BYTES)
 
     num_bytes_read = len(raw_header)
     if num_bytes_read < TEXTUAL_HEADER_NUM_BYTES:
         raise EOFError("Only {} bytes of {} byte textual reel header could be read"
                        .format(num_bytes_read, TEXTUAL_HEADER_NUM_BYTES))
+    return raw_header
 
-    lines = tuple(bytes(raw_line).decode(encoding) for raw_line in batched(raw_header, CARD_LENGTH))
-    return lines
+
+def decode_textual_reel_header(raw_header, encoding):
+    """Decode the bytes of a SEG Y card image header into lines of text.
+
+    Args:
+        raw_header: The bytes of the textual header, as obtained by
+            read_raw_textual_reel_header().
+
+        encoding: Either 'cp037' for EBCDIC or 'ascii' for ASCII.
+
+    Returns:
+        A tuple of forty Unicode strings containing the transcoded header data.
+    """
+    return tuple(raw_header[i:i + CARD_LENGTH].decode(encoding)
+                 for i in range(0, TEXTUAL_HEADER_NUM_BYTES, CARD_LENGTH))
 
 
 def read_binary_reel_header(fh, endian='>'):
@@ -354,6 +389,8 @@ def read_extended_textual_headers(fh, binary_reel_header, encoding):
 _READ_PROPORTION = 0.75  # The proportion of time spent in catalog_traces
                          # reading the file. Determined empirically.
 
+_CATALOG_READ_BUFFER_SIZE = 64 * 1024  # Bytes buffered when scanning unbuffered files
+
 
 def catalog_traces(fh, bps, trace_header_format=TraceHeaderRev1, endian='>', progress=None):
     """Build catalogs to facilitate random access to trace_samples data.
@@ -409,51 +446,81 @@ def catalog_traces(fh, bps, trace_header_format=TraceHeaderRev1, endian='>', pro
     if not callable(progress_callback):
         raise TypeError("catalog_traces(): progress callback must be callable")
 
-    class CatalogSubFormat(metaclass=SubFormatMeta,
-                           parent_format=trace_header_format,
-                           parent_field_names=(
-                               'file_sequence_num',
-                               'ensemble_num',
-                               'num_samples',
-                               'inline_number',
-                               'crossline_number',
-                           )):
-        pass
-
-    trace_header_packer = make_header_packer(CatalogSubFormat, endian)
+    trace_header_struct, catalog_fields = _catalog_trace_header_struct(trace_header_format, endian)
 
     length = file_length(fh)
 
     pos_begin = fh.tell()
 
+    # Accumulate the catalog data in lists, which are passed to the catalog
+    # builders in bulk once the scan is complete.
+    trace_offsets = []
+    trace_lengths = []
+    line_numbers = []
+    alt_line_numbers = []
+    ensemble_nums = []
+
+    # Where possible, map the file into memory so that each trace header
+    # can be unpacked in place without a seek and read system call, or an
+    # intermediate copy, per trace.
+    mapped_file = _map_file_read_only(fh)
+
+    # Otherwise, if the file is unbuffered, serve the small header reads from
+    # a user-space buffer rather than making a system call for each one.
+    if mapped_file is None and isinstance(fh, io.RawIOBase):
+        scan_fh = io.BufferedReader(fh, buffer_size=_CATALOG_READ_BUFFER_SIZE)
+    else:
+        scan_fh = fh
+
+    try:
+        while True:
+            progress_callback(_READ_PROPORTION * pos_begin / length)
+            if mapped_file is not None:
+                if pos_begin + TRACE_HEADER_NUM_BYTES > length:
+                    break
+                values = trace_header_struct.unpack_from(mapped_file, pos_begin)
+            else:
+                scan_fh.seek(pos_begin)
+                data = scan_fh.read(TRACE_HEADER_NUM_BYTES)
+                if len(data) < TRACE_HEADER_NUM_BYTES:
+                    break
+                values = trace_header_struct.unpack(data)
+
+            (file_sequence_num, ensemble_num, num_samples,
+             inline_number, crossline_number) = catalog_fields(values)
+
+            trace_lengths.append(num_samples)
+            samples_bytes = num_samples * bps
+            trace_offsets.append(pos_begin)
+            # Should we check the data actually exists?
+            line_numbers.append((inline_number, crossline_number))
+            alt_line_numbers.append((file_sequence_num, ensemble_num))
+            ensemble_nums.append(ensemble_num)
+            pos_end = pos_begin + TRACE_HEADER_NUM_BYTES + samples_bytes
+            pos_begin = pos_end
+    finally:
+        if mapped_file is not None:
+            mapped_file.close()
+        if scan_fh is not fh:
+            # Release the underlying file without closing it
+            scan_fh.detach()
+
+    trace_numbers = range(len(trace_offsets))
+
     trace_offset_catalog_builder = CatalogBuilder()
+    trace_offset_catalog_builder.extend(trace_numbers, trace_offsets)
+
     trace_length_catalog_builder = CatalogBuilder()
+    trace_length_catalog_builder.extend(trace_numbers, trace_lengths)
+
     line_catalog_builder = CatalogBuilder()
+    line_catalog_builder.extend(line_numbers, trace_numbers)
+
     alt_line_catalog_builder = CatalogBuilder()
-    cdp_catalog_builder = CatalogBuilder()
+    alt_line_catalog_builder.extend(alt_line_numbers, trace_numbers)
 
-    for trace_number in count():
-        progress_callback(_READ_PROPORTION * pos_begin / length)
-        fh.seek(pos_begin)
-        data = fh.read(TRACE_HEADER_NUM_BYTES)
-        if len(data) < TRACE_HEADER_NUM_BYTES:
-            break
-        trace_header = trace_header_packer.unpack(data)
-
-        num_samples = trace_header.num_samples
-        trace_length_catalog_builder.add(trace_number, num_samples)
-        samples_bytes = num_samples * bps
-        trace_offset_catalog_builder.add(trace_number, pos_begin)
-        # Should we check the data actually exists?
-        line_catalog_builder.add((trace_header.inline_number,
-                                  trace_header.crossline_number),
-                                 trace_number)
-        alt_line_catalog_builder.add((trace_header.file_sequence_num,
-                                     trace_header.ensemble_num),
-                                     trace_number)
-        cdp_catalog_builder.add(trace_header.ensemble_num, trace_number)
-        pos_end = pos_begin + TRACE_HEADER_NUM_BYTES + samples_bytes
-        pos_begin = pos_end
+    cdp_catalog_builder = CatalogBuilder()
+    cdp_catalog_builder.extend(ensemble_nums, trace_numbers)
 
     progress_callback(_READ_PROPORTION)
 
@@ -480,14 +547,84 @@ def catalog_traces(fh, bps, trace_header_format=TraceHeaderRev1, endian='>', pro
             line_catalog)
 
 
+_CATALOG_FIELD_NAMES = (
+    'file_sequence_num',
+    'ensemble_num',
+    'num_samples',
+    'inline_number',
+    'crossline_number',
+)
+
+
+@lru_cache(maxsize=32)
+def _catalog_trace_header_struct(trace_header_format, endian):
+    """Compile a structure for decoding only the trace header fields needed for cataloguing.
+
+    The fields are decoded into a plain tuple rather than a header object, which
+    avoids the cost of constructing and validating a header for every trace.
+    The result is cached, so each trace header format is compiled at most once
+    for each endianness.
+
+    Args:
+        trace_header_format: The class defining the trace header format.
+
+        endian: '>' for big-endian data (the standard and default), '<'
+            for little-endian (non-standard)
+
+    Returns:
+        A 2-tuple containing a struct.Struct which decodes a complete trace header,
+        skipping all but the catalog fields, and a callable which when passed the
+        tuple unpacked by that Struct returns the values of the fields named in
+        _CATALOG_FIELD_NAMES, in that order.
+    """
+    class CatalogSubFormat(metaclass=SubFormatMeta,
+                           parent_format=trace_header_format,
+                           parent_field_names=_CATALOG_FIELD_NAMES):
+        pass
+
+    cformat, field_name_allocations = compile_struct(
+        CatalogSubFormat,
+        CatalogSubFormat.START_OFFSET_IN_BYTES,
+        CatalogSubFormat.LENGTH_IN_BYTES,
+        endian)
+
+    value_index = {name: index
+                   for index, names in enumerate(field_name_allocations)
+                   for name in names}
+
+    catalog_fields = itemgetter(*(value_index[name] for name in _CATALOG_FIELD_NAMES))
+    return struct.Struct(cformat), catalog_fields
+
+
+def _map_file_read_only(fh):
+    """Map the file underlying a file-like object into memory for reading.
+
+    Args:
+        fh: A file-like object open in binary mode.
+
+    Returns:
+        A read-only mmap object covering the whole file, or None if the
+        file-like object is not a plain operating system file (for example an
+        in-memory stream, or a decompressing stream such as a GzipFile whose
+        fileno() refers to the compressed file), or is an empty file.
+    """
+    raw = fh.raw if isinstance(fh, (io.BufferedReader, io.BufferedRandom)) else fh
+    if not isinstance(raw, io.FileIO):
+        return None
+    try:
+        return mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
 def read_trace_header(fh, trace_header_packer, pos=None):
     """Read a trace_samples header.
 
     Args:
         fh: A file-like-object open in binary mode.
 
-        trace_header_format: A Struct object, such as obtained from a
-            call to compile_trace_header_format()
+        trace_header_packer: A HeaderPacker, such as obtained from a
+            call to make_header_packer()
 
         pos: The file offset in bytes from the beginning from which the data
             is to be read.
@@ -498,8 +635,6 @@ def read_trace_header(fh, trace_header_packer, pos=None):
     if pos is not None:
         fh.seek(pos)
     data = fh.read(TRACE_HEADER_NUM_BYTES)
-    # trace_header = TraceHeader._make(
-    #     trace_header_format.unpack(data))
     trace_header = trace_header_packer.unpack(data)
     return trace_header
 
@@ -530,13 +665,11 @@ def read_binary_values(fh, pos=None, seg_y_type='int32', num_items=1, endian='>'
     values = (unpack_ibm_floats(buf, num_items)
               if ctype == 'ibm'
               else unpack_values(buf, ctype, endian))
-    assert len(values) == num_items
     return values
 
 
 def unpack_ibm_floats_py(data, num_items):
-    return [IBMFloat.from_bytes(data[i: i+4])
-            for i in range(0, num_items * 4, 4)]
+    return IBMFloat.series_from_bytes(data, num_items)
 
 
 def unpack_ibm_floats(data, num_items):
@@ -915,8 +1048,12 @@ def write_binary_values(fh, values, seg_y_type, pos=None, endian='>'):
 
 
 def pack_ibm_floats_py(values):
-    return EMPTY_BYTE_STRING.join(bytes(IBMFloat.from_real(value))
-                                  for value in values)
+    # Convert directly to bytes, without constructing an intermediate
+    # IBMFloat for each value, accumulating into a single buffer.
+    packed = bytearray()
+    for value in values:
+        packed += bytes(value) if isinstance(value, IBMFloat) else ieee2ibm(value)
+    return bytes(packed)
 
 
 def pack_ibm_floats(values):
@@ -946,5 +1083,14 @@ def pack_values(values, ctype, endian='>'):
         endian: '>' for big-endian data (the standard and default), '<'
             for little-endian (non-standard)
     """
-    c_format = '{}{}{}'.format(endian, len(values), ctype)
-    return struct.pack(c_format, *values)
+    return _values_struct(endian, len(values), ctype).pack(*values)
+
+
+@lru_cache(maxsize=64)
+def _values_struct(endian, num_items, ctype):
+    """A compiled structure for packing a series of values of the same type.
+
+    Traces in a SEG Y file usually share a few lengths, so the structures are
+    cached to avoid building and parsing a format string for every trace.
+    """
+    return struct.Struct('{}{}{}'.format(endian, num_items, ctype))
@@ -20,7 +20,7 @@ UNSET = object()
 
 def pairwise(iterable):
     a, b = tee(iterable)
-    next(b)
+    next(b, None)
     yield from zip(a, b)
 
 
@@ -196,16 +196,57 @@ def measure_stride(iterable):
         that difference is the same between all successive pairs, otherwise
         None.
     """
-    stride = None
-    for a, b in pairwise(iterable):
-        new_stride = b - a
-        if stride is None:
-            stride = new_stride
-        elif stride != new_stride:
+    iterator = iter(iterable)
+    try:
+        previous = next(iterator)
+        current = next(iterator)
+    except StopIteration:
+        return None
+
+    stride = current - previous
+    previous = current
+    for current in iterator:
+        if current - previous != stride:
             return None
+        previous = current
     return stride
 
 
+def measure_stride_and_duplicates(sorted_iterable):
+    """Determine in a single pass the stride of, and any duplicates in, a sorted series.
+
+    Args:
+        sorted_iterable: An iterable series of numeric values which must be
+            sorted in either ascending or descending order.
+
+    Returns:
+        A 2-tuple containing in the zeroth element the difference between
+        successive values if that difference is the same between all
+        successive pairs, otherwise None, and in the first element True if
+        sorted_iterable contains duplicates, otherwise False. If there are
+        duplicates the stride is always None.
+    """
+    iterator = iter(sorted_iterable)
+    try:
+        previous = next(iterator)
+        current = next(iterator)
+    except StopIteration:
+        return None, False
+
+    stride = current - previous
+    if stride == 0:
+        return None, True
+    previous = current
+    for current in iterator:
+        new_stride = current - previous
+        if new_stride != stride:
+            if new_stride == 0:
+                return None, True
+            stride = None
+        previous = current
+    return stride, False
+
+
 def minmax(iterable):
     """Return the minimum and maximum of an iterable series.
 
@@ -322,11 +363,6 @@ def flatten(sequence_of_sequences):
     return chain.from_iterable(sequence_of_sequences)
 
 
-def four_bytes(byte_str):
-    a, b, c, d = byte_str[:4]
-    return a, b, c, d
-
-
 def single_item_range(item):
     """Construct a range object which generates a single value.
     """
@@ -1,37 +1,14 @@
-from distutils.core import setup
-from setuptools import find_packages
-import versioneer
+# Package metadata is declared statically in pyproject.toml. This shim
+# remains only so that versioneer can supply the version and its commands.
+import os
+import sys
 
-CLASSIFIERS = [
-    'Development Status :: 4 - Beta',
-    'Intended Audience :: Developers',
-    'Intended Audience :: Science/Research',
-    'License :: OSI Approved :: MIT License',
-    'Programming Language :: Python',
-    'Topic :: Scientific/Engineering',
-    'Topic :: Scientific/Engineering :: Mathematics',
-    'Topic :: Scientific/Engineering :: Physics',
-    'Operating System :: Microsoft :: Windows',
-    'Operating System :: POSIX',
-    'Operating System :: Unix',
-    'Operating System :: MacOS',
-    'Natural Language :: English',
-]
+from setuptools import setup
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import versioneer  # noqa: E402
 
 setup(
-    name='segpy-lite',
     version=versioneer.get_version(),
     cmdclass=versioneer.get_cmdclass(),
-    description='Transfer of seismic data to and from SEG Y files',
-    long_description="",
-    url='https://github.com/whimian/segpy-lite',
-    author='Yu Hao',
-    author_email='yuhao89@live.cn',
-    license='MIT',
-    classifiers=CLASSIFIERS,
-    keywords='seismic geocomputing geophysics',
-    packages=find_packages(exclude=['test']),
-    platforms=["Windows", "Linux", "Solaris", "Mac OS-X", "Unix"],
-    zip_safe=False
 )
@@ -1,6 +1,7 @@
 from hypothesis import given, assume
 from hypothesis.strategies import (dictionaries, just,
-                                   integers, streaming, tuples)
+                                   integers, lists, tuples)
+from pytest import raises
 from segpy.catalog import CatalogBuilder
 
 
@@ -36,7 +37,7 @@ class TestCatalogBuilder:
     @given(start=integers(),
            num=integers(0, 10000),
            step=integers(-10000, 10000),
-           values=streaming(integers()))
+           values=lists(integers(), max_size=1000))
     def test_regular_mapping(self, start, num, step, values):
         assume(step != 0)
         mapping = {key: value for key, value in zip(
@@ -90,3 +91,22 @@ class TestCatalogBuilder:
         catalog = builder.create()
         shared_items = set(mapping.items()) & set(catalog.items())
         assert len(shared_items) == len(mapping)
+
+    @given(dictionaries(integers(), integers()))
+    def test_extend_is_equivalent_to_add(self, mapping):
+        add_builder = CatalogBuilder()
+        for key, value in mapping.items():
+            add_builder.add(key, value)
+
+        extend_builder = CatalogBuilder()
+        extend_builder.extend(iter(mapping.keys()), iter(mapping.values()))
+
+        add_catalog = add_builder.create()
+        extend_catalog = extend_builder.create()
+        assert type(add_catalog) is type(extend_catalog)
+        assert dict(add_catalog.items()) == dict(extend_catalog.items())
+
+    def test_extend_with_mismatched_lengths_raises_value_error(self):
+        builder = CatalogBuilder()
+        with raises(ValueError):
+            builder.extend([1, 2, 3], [4, 5])
@@ -4,11 +4,12 @@ import pytest
 
 from hypothesis import given, assume
 from hypothesis.errors import UnsatisfiedAssumption
-from hypothesis.strategies import integers, floats, one_of, just
+from hypothesis.strategies import integers, floats, one_of, just, binary
 
 from segpy.ibm_float import (ieee2ibm, ibm2ieee, MAX_IBM_FLOAT, SMALLEST_POSITIVE_NORMAL_IBM_FLOAT,
                              LARGEST_NEGATIVE_NORMAL_IBM_FLOAT, MIN_IBM_FLOAT, IBMFloat, EPSILON_IBM_FLOAT,
-                             MAX_EXACT_INTEGER_IBM_FLOAT, MIN_EXACT_INTEGER_IBM_FLOAT, EXPONENT_BIAS)
+                             MAX_EXACT_INTEGER_IBM_FLOAT, MIN_EXACT_INTEGER_IBM_FLOAT, EXPONENT_BIAS,
+                             IBM_POSITIVE_ONE_BYTES)
 
 from segpy.util import almost_equal
 
@@ -94,6 +95,16 @@ class Ibm2Ieee:
         assert ibm2ieee(bytes((0x00, 0x00, 0x00, 0x01))) == 5.147557589468029e-85
 
 
+class TestIbm2IeeeOffset:
+
+    def test_offset(self):
+        assert ibm2ieee(bytes((0xff, 0xff, 0b11000010, 0b01110110, 0b10100000, 0b00000000)), 2) == -118.625
+
+    def test_zero_offset_is_default(self):
+        data = bytes((0b11000010, 0b01110110, 0b10100000, 0b00000000))
+        assert ibm2ieee(data, 0) == ibm2ieee(data)
+
+
 class Ieee2Ibm:
 
     def test_zero(self):
@@ -397,3 +408,24 @@ class TestIBMFloat:
         ieee_c = ieee_a - ieee_b
 
         assert almost_equal(ieee_c, ibm_c, epsilon=EPSILON_IBM_FLOAT)
+
+
+class TestIBMFloatSeriesFromBytes:
+
+    @given(binary(max_size=400))
+    def test_equivalent_to_from_bytes(self, data):
+        num_items = len(data) // 4
+        ibms = IBMFloat.series_from_bytes(data, num_items)
+        assert [bytes(ibm) for ibm in ibms] == [bytes(IBMFloat.from_bytes(data[i:i + 4]))
+                                                for i in range(0, num_items * 4, 4)]
+
+    def test_too_few_bytes_raises_value_error(self):
+        with pytest.raises(ValueError):
+            IBMFloat.series_from_bytes(b'\x00' * 7, 2)
+
+    def test_subclass(self):
+        class MyIBMFloat(IBMFloat):
+            __slots__ = []
+
+        ibms = MyIBMFloat.series_from_bytes(IBM_POSITIVE_ONE_BYTES * 2, 2)
+        assert all(type(ibm) is MyIBMFloat for ibm in ibms)
@@ -1,7 +1,14 @@
+import gzip
+import io
+import os
+import tempfile
+
 from hypothesis import given
 import hypothesis.strategies as st
 import pytest
 from segpy.ibm_float import EPSILON_IBM_FLOAT, ieee2ibm
+from segpy.packer import make_header_packer
+from segpy.trace_header import TraceHeaderRev1
 import segpy.toolkit as toolkit
 from segpy.util import almost_equal
 from unittest.mock import patch
@@ -113,3 +120,87 @@ class TestUnpackImplementationSelection:
              test.util.force_python_ibm_float(False):
             toolkit.unpack_ibm_floats(*data)
             assert mock.called
+
+
+class TestCatalogTraceHeaderStruct:
+    @given(st.integers(min_value=-2**31, max_value=2**31 - 1),
+           st.integers(min_value=-2**31, max_value=2**31 - 1),
+           st.integers(min_value=0, max_value=2**15 - 1),
+           st.integers(min_value=-2**31, max_value=2**31 - 1),
+           st.integers(min_value=-2**31, max_value=2**31 - 1),
+           st.sampled_from('<>'))
+    def test_catalog_fields_match_header(self, file_sequence_num, ensemble_num, num_samples,
+                                         inline_number, crossline_number, endian):
+        header = TraceHeaderRev1(file_sequence_num=file_sequence_num,
+                                 ensemble_num=ensemble_num,
+                                 num_samples=num_samples,
+                                 inline_number=inline_number,
+                                 crossline_number=crossline_number)
+        data = make_header_packer(TraceHeaderRev1, endian).pack(header)
+        structure, catalog_fields = toolkit._catalog_trace_header_struct(TraceHeaderRev1, endian)
+        assert catalog_fields(structure.unpack(data)) == (file_sequence_num, ensemble_num, num_samples,
+                                                          inline_number, crossline_number)
+
+
+def make_trace_data(trace_lengths):
+    packer = make_header_packer(TraceHeaderRev1)
+    return b''.join(packer.pack(TraceHeaderRev1(file_sequence_num=trace_number + 1,
+                                                ensemble_num=trace_number + 1,
+                                                num_samples=num_samples,
+                                                inline_number=1,
+                                                crossline_number=trace_number + 1))
+                    + bytes(num_samples * 4)
+                    for trace_number, num_samples in enumerate(trace_lengths))
+
+
+def catalog_items(catalogs):
+    return [dict(catalog.items()) for catalog in catalogs]
+
+
+class TestCatalogTraces:
+    @given(st.lists(st.integers(min_value=0, max_value=20), min_size=1, max_size=10))
+    def test_unbuffered_file_without_mapping_gives_same_catalogs(self, trace_lengths):
+        data = make_trace_data(trace_lengths)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'traces.bin')
+            with open(path, 'wb') as fh:
+                fh.write(data)
+
+            with open(path, 'rb', buffering=0) as fh:
+                mapped_catalogs = toolkit.catalog_traces(fh, 4)
+
+            with open(path, 'rb', buffering=0) as fh,\
+                 patch('segpy.toolkit._map_file_read_only', return_value=None):
+                buffered_catalogs = toolkit.catalog_traces(fh, 4)
+                assert not fh.closed
+
+        assert catalog_items(mapped_catalogs) == catalog_items(buffered_catalogs)
+
+    @pytest.mark.parametrize('buffering', [0, -1])
+    def test_mapped_file_gives_same_catalogs_as_in_memory_stream(self, buffering):
+        data = make_trace_data([10, 20, 0, 5])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'traces.bin')
+            with open(path, 'wb') as fh:
+                fh.write(data)
+
+            with open(path, 'rb', buffering=buffering) as fh:
+                mapped_file = toolkit._map_file_read_only(fh)
+                assert mapped_file is not None
+                mapped_file.close()
+                file_catalogs = toolkit.catalog_traces(fh, 4)
+
+        assert catalog_items(file_catalogs) == catalog_items(toolkit.catalog_traces(io.BytesIO(data), 4))
+
+    def test_gzip_file_is_not_mapped(self):
+        data = make_trace_data([10, 20, 0, 5])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'traces.bin.gz')
+            with gzip.open(path, 'wb') as fh:
+                fh.write(data)
+
+            with gzip.open(path, 'rb') as fh:
+                assert toolkit._map_file_read_only(fh) is None
+                gzip_catalogs = toolkit.catalog_traces(fh, 4)
+
+        assert catalog_items(gzip_catalogs) == catalog_items(toolkit.catalog_traces(io.BytesIO(data), 4))
@@ -1,6 +1,7 @@
 from hypothesis import given, assume, example
 from hypothesis.strategies import integers, lists
-from segpy.util import batched, complementary_intervals, flatten, intervals_are_contiguous, roundrobin
+from segpy.util import batched, complementary_intervals, flatten, intervals_are_contiguous, roundrobin, \
+    contains_duplicates, measure_stride, measure_stride_and_duplicates, pairwise
 from test.strategies import spaced_ranges
 
 
@@ -73,3 +74,43 @@ class TestComplementaryIntervals:
         end_index = last_interval_end + end_offset
         complements = list(complementary_intervals(intervals, stop=end_index))
         assert complements[-1] == range(last_interval_end, end_index)
+
+
+class TestPairwise:
+
+    def test_empty(self):
+        assert list(pairwise([])) == []
+
+    def test_single_item(self):
+        assert list(pairwise([1])) == []
+
+    @given(lists(integers()))
+    def test_pairs(self, items):
+        assert list(pairwise(items)) == list(zip(items, items[1:]))
+
+
+class TestContainsDuplicates:
+
+    def test_empty(self):
+        assert not contains_duplicates([])
+
+    def test_duplicates(self):
+        assert contains_duplicates([1, 2, 2, 3])
+
+
+class TestMeasureStrideAndDuplicates:
+
+    @given(lists(integers()))
+    def test_consistent_with_separate_passes(self, items):
+        items.sort()
+        stride, has_duplicates = measure_stride_and_duplicates(items)
+        assert has_duplicates == contains_duplicates(items)
+        if not has_duplicates:
+            assert stride == measure_stride(items)
+
+    @given(integers(), integers(2, 100), integers(1, 1000))
+    def test_regular(self, start, num, step):
+        assert measure_stride_and_duplicates(range(start, start + num * step, step)) == (step, False)
+
+    def test_duplicates(self):
+        assert measure_stride_and_duplicates([1, 2, 2, 3]) == (None, True)